@@ -1,22 +1,270 @@
 # app.py
 
 import streamlit as st
-import google.generativeai as genai
 import os
 from dotenv import load_dotenv
 import logging
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
 from io import BytesIO
-from word_report import perform_seo_audit, create_word_report
+from urllib.parse import urlparse, urlunparse
 
-# ------------------- Streamlit UI -------------------
-st.set_page_config(
-    page_title="AI Chatbot & SEO Auditor",
-    page_icon="🤖",
-    layout="wide"
-)
 
-# Custom CSS
-st.markdown("""
+# ------------------- CACHED HELPERS -------------------
+def normalize_url(url):
+    """Lowercases scheme/host and drops trailing slashes and fragments so URL variants share a cache entry.
+
+    Only a cache key: the URL that is fetched and reported stays as the user typed it.
+    """
+    try:
+        parts = urlparse(url.strip())
+    except ValueError:
+        return url.strip()  # malformed (e.g. "http://[::1"); the audit reports the error
+    return urlunparse((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/") or "/",
+        parts.params,
+        parts.query,
+        "",
+    ))
+
+
+AUDIT_MEMO_SIZE = 20
+AUDIT_CACHE_SIZE = 128
+AUDIT_TTL = 24 * 60 * 60
+
+
+@st.cache_data(ttl=AUDIT_TTL, max_entries=AUDIT_CACHE_SIZE, show_spinner=False)
+def cached_audit(cache_key, _url, _fresh=False):
+    """Runs the SEO audit once per normalized URL (cache_key) per day.
+
+    _url is excluded from the cache hash; it's the address that is actually fetched,
+    because normalizing can change the request (e.g. /blog/ -> /blog, then a 301).
+    _fresh skips the conditional GET so a re-audit re-downloads the page.
+    """
+    from word_report import perform_seo_audit
+    return perform_seo_audit(_url, revalidate=not _fresh)
+
+
+@st.cache_data(ttl=AUDIT_TTL, max_entries=AUDIT_CACHE_SIZE, show_spinner=False)
+def render_summary(seo_data_json):
+    """Formats the audit dict as one markdown block instead of one st.markdown call per line."""
+    sections = []
+    for key, value in json.loads(seo_data_json).items():
+        if isinstance(value, list) and value:
+            items = (f"{item[0]} ({item[1]})" if isinstance(item, list) else item for item in value)
+            sections.append(f"**{key}**:\n" + "\n".join(f"- {item}" for item in items))
+        else:
+            sections.append(f"**{key}**: {value}")
+    return "\n\n".join(sections)
+
+
+def report_filename(url):
+    # Not cached: hashing the argument for st.cache_data would cost more than the f-string
+    return f"seo_report_{urlparse(url).netloc or 'site'}.docx"
+
+
+@st.cache_data(ttl=AUDIT_TTL, max_entries=AUDIT_CACHE_SIZE, show_spinner=False)
+def build_docx_bytes(seo_data_json):
+    """Renders the Word report once per audit result and returns the finished .docx bytes."""
+    from word_report import create_word_report
+    doc_stream = BytesIO()
+    create_word_report(json.loads(seo_data_json)).save(doc_stream)
+    return doc_stream.getvalue()
+
+
+@st.cache_resource
+def _genai():
+    """Imports and configures the Gemini SDK on first use only; users who just run audits never load it."""
+    logging.getLogger('google.auth').setLevel(logging.ERROR)
+    logging.getLogger('google.api_core').setLevel(logging.ERROR)
+    import google.generativeai as genai
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+    return genai
+
+
+@st.cache_resource
+def _load_env():
+    """Reads .env once per process rather than on every rerun."""
+    load_dotenv()
+
+
+@st.cache_resource
+def get_model(name):
+    """Builds one GenerativeModel per model name and reuses it across reruns."""
+    return _genai().GenerativeModel(name)
+
+
+# ------------------- REPLY CACHE -------------------
+EMBED_MODEL = "models/gemini-embedding-001"
+REPLY_TTL = 60 * 60
+REPLY_CACHE_SIZE = 256
+SEMANTIC_THRESHOLD = 0.95
+# Per session: how many scopes the semantic cache keeps, and prompts per scope
+SEMANTIC_CACHE_SIZE = 64
+SEMANTIC_SCOPE_SIZE = 8
+
+
+@st.cache_resource
+def reply_cache():
+    """Process-wide exact-match cache: sha1(model + context + prompt) -> (timestamp, reply)."""
+    return {}
+
+
+def prompt_key(model_name, context, prompt):
+    return hashlib.sha1("\n".join((model_name, context, prompt)).encode("utf-8")).hexdigest()
+
+
+async def embed_prompt(prompt):
+    """Returns a unit-length embedding for the prompt, or None if the embedding call fails."""
+    try:
+        result = await _genai().embed_content_async(model=EMBED_MODEL, content=prompt)
+    except Exception:
+        return None
+    import numpy as np  # only the semantic cache needs it; keeps it off cold start
+    vector = np.asarray(result["embedding"], dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def exact_reply(key):
+    hit = reply_cache().get(key)
+    if hit and time.time() - hit[0] < REPLY_TTL:
+        return hit[1]
+    return None
+
+
+def semantic_reply(sem_cache, scope, vector):
+    """Returns the cached reply whose prompt embedding is closest to vector, if it's close enough.
+
+    Only entries stored under the same scope, (model name, previous reply), are
+    compared, for the same reason the exact-match key includes both: "tell me more"
+    means something different after every answer.
+    """
+    if vector is None or scope not in sem_cache:
+        return None
+    sem_cache.move_to_end(scope)
+    vectors, replies = sem_cache[scope]
+    scores = vectors @ vector
+    best = int(scores.argmax())
+    return replies[best] if scores[best] > SEMANTIC_THRESHOLD else None
+
+
+def store_reply(key, scope, vector, reply):
+    cache = reply_cache()
+    cache[key] = (time.time(), reply)
+    if len(cache) > REPLY_CACHE_SIZE:
+        # Shared across sessions: another script thread may evict the same entry first
+        cache.pop(next(iter(cache), None), None)
+    if vector is not None:
+        import numpy as np
+        # Per scope, the embeddings are kept stacked as one matrix, so a lookup is a
+        # single matrix-vector product
+        sem_cache = st.session_state.setdefault("sem_cache", OrderedDict())
+        vectors, replies = sem_cache.pop(scope, (vector[None][:0], []))
+        keep = SEMANTIC_SCOPE_SIZE - 1
+        sem_cache[scope] = (np.vstack((vectors[-keep:], vector)), replies[-keep:] + [reply])
+        if len(sem_cache) > SEMANTIC_CACHE_SIZE:
+            sem_cache.popitem(last=False)
+
+
+# ------------------- ASYNC GEMINI -------------------
+@st.cache_resource
+def _event_loop():
+    """One long-lived loop in a daemon thread; the async Gemini client stays bound to the loop it was created on."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def run_async(coro):
+    """Schedules coro on the shared loop and returns a concurrent.futures.Future for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop())
+
+
+async def start_turn(chat, prompt, sem_cache, scope):
+    """Embeds the prompt and only sends it to Gemini when no cached prompt is close enough.
+
+    Returns (vector, cached_reply, response); exactly one of the last two is None.
+    """
+    vector = await embed_prompt(prompt)
+    cached = semantic_reply(sem_cache, scope, vector)
+    if cached is not None:
+        return vector, cached, None
+    return vector, None, await chat.send_message_async(prompt, stream=True)
+
+
+async def _next_chunk(chunks):
+    return await chunks.__anext__()
+
+
+def stream_chunks(response):
+    """Bridges an async streamed response into the sync generator st.write_stream expects."""
+    chunks = response.__aiter__()
+    while True:
+        try:
+            chunk = run_async(_next_chunk(chunks)).result()
+        except StopAsyncIteration:
+            return
+        if chunk.parts:
+            yield chunk.text
+
+
+# ------------------- CHAT SESSION -------------------
+# Only the most recent exchanges are sent back to Gemini, so prompt size (and
+# cost) stays flat however long the conversation runs
+HISTORY_TURNS = 10
+
+
+def trim_history(chat):
+    # The getter returns the session's own list; deleting in place avoids the setter,
+    # which would re-convert every remaining turn
+    history = chat.history
+    if len(history) > 2 * HISTORY_TURNS:
+        del history[:-2 * HISTORY_TURNS]
+
+
+# ------------------- CHAT TRANSCRIPT -------------------
+MAX_MESSAGES = 500
+HISTORY_WINDOW = 50
+
+
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+
+
+def close_fences(text):
+    """Closes a code fence left open (e.g. a reply cut off at MAX_TOKENS).
+
+    Past messages are joined into one markdown block, so an unclosed fence would
+    otherwise turn every later message into code.
+    """
+    fence = None
+    for line in text.splitlines():
+        match = _FENCE.match(line)
+        if not match:
+            continue
+        run, rest = match.groups()
+        if fence is None:
+            fence = run
+        elif run[0] == fence[0] and len(run) >= len(fence) and not rest.strip():
+            fence = None
+    return text if fence is None else f"{text}\n{fence}"
+
+
+def message_markdown(message):
+    content = close_fences(message["content"])
+    if message["role"] == "user":
+        return f"**👤 You:**\n\n{content}"
+    return f"**🤖 Gemini:**\n\n{content}"
+
+
+# ------------------- STYLES -------------------
+_BASE_CSS = """
     <style>
     .stApp { background: linear-gradient(135deg, #EEAECA 0%, #94BBE9 100%); }
     .stTextInput>div>div>input {
@@ -25,7 +273,7 @@ st.markdown("""
         border: 1px solid #ccc;
         padding: 10px;
     }
-    .stButton>button {
+    .stButton>button, .stFormSubmitButton>button {
         background-color: #007bff;
         color: white;
         border-radius: 10px;
@@ -37,107 +285,189 @@ st.markdown("""
         border-radius: 10px;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+
+# Small per-theme overrides layered on top of the base stylesheet
+_DARK_CSS = '<style> .stApp { background: #0e1117; color: white; } </style>'
+_LIGHT_CSS = '<style> .stApp { background: linear-gradient(135deg, #a8e063 0%, #56ab2f 100%); } </style>'
+
+
+# ------------------- Streamlit UI -------------------
+st.set_page_config(
+    page_title="AI Chatbot & SEO Auditor",
+    page_icon="🤖",
+    layout="wide"
+)
+
+# Custom CSS (a module constant, so nothing is rebuilt per rerun). It has to be
+# emitted on every run: Streamlit removes any element a rerun doesn't write again.
+st.markdown(_BASE_CSS, unsafe_allow_html=True)
 
 st.title("AI Chatbot with SEO Audit")
 st.markdown("Enter a website URL below to generate an on-page SEO audit report in a Word document.")
 
 # ------------------- SEO AUDIT SECTION -------------------
-url_input = st.text_input("Website URL", placeholder="e.g., https://streamlit.io")
+# A form only reruns the script on submit, not on every edit of the URL field
+with st.form("seo_form"):
+    url_input = st.text_input("Website URL", placeholder="e.g., https://streamlit.io")
+    submitted = st.form_submit_button("Generate SEO Report")
+    reaudit = st.form_submit_button("🔄 Re-audit (ignore cached result)")
 
-if st.button("Generate SEO Report"):
+if submitted or reaudit:
     if url_input:
-        with st.spinner("Analyzing website... please wait..."):
-            seo_data = perform_seo_audit(url_input)
+        target_url = url_input.strip()
+        audit_url = normalize_url(target_url)
+        # Session-local memo on top of cache_data, so repeat audits in this session
+        # survive global cache eviction
+        audit_memo = st.session_state.setdefault("audit_cache", OrderedDict())
+        if reaudit:
+            audit_memo.pop(audit_url, None)
+            cached_audit.clear(audit_url)
+        if audit_url in audit_memo:
+            audit_memo.move_to_end(audit_url)
+            seo_data = audit_memo[audit_url]
+        else:
+            with st.spinner("Analyzing website... please wait..."):
+                seo_data = cached_audit(audit_url, target_url, _fresh=reaudit)
+            if "Error" not in seo_data:
+                audit_memo[audit_url] = seo_data
+                if len(audit_memo) > AUDIT_MEMO_SIZE:
+                    audit_memo.popitem(last=False)
         
         if "Error" in seo_data:
+            # Don't keep failed fetches around; the next click should retry
+            cached_audit.clear(audit_url)
             st.error(seo_data["Error"])
         else:
             st.success("✅ Audit complete! Report ready.")
             
+            seo_json = json.dumps(seo_data, default=str)
             with st.expander("🔍 Show Audit Summary"):
-                for key, value in seo_data.items():
-                    if isinstance(value, list) and value:
-                        st.markdown(f"**{key}**:")
-                        for item in value:
-                            st.markdown(f"- {item}")
-                    else:
-                        st.markdown(f"**{key}**: {value}")
+                st.markdown(render_summary(seo_json))
 
             # Create Word document
-            word_doc = create_word_report(seo_data)
-            doc_stream = BytesIO()
-            word_doc.save(doc_stream)
-            doc_stream.seek(0)
+            doc_bytes = build_docx_bytes(seo_json)
             
             st.download_button(
                 label="📄 Download SEO Report (Word)",
-                data=doc_stream,
-                file_name=f"seo_report_{url_input.split('//')[-1].split('/')[0]}.docx",
+                data=doc_bytes,
+                file_name=report_filename(audit_url),
                 mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
             )
     else:
         st.warning("⚠️ Please enter a valid URL.")
 
 # ------------------- GEMINI SETUP -------------------
-logging.getLogger('google.auth').setLevel(logging.ERROR)
-logging.getLogger('google.api_core').setLevel(logging.ERROR)
-
-load_dotenv()
+_load_env()
 
 api_key = os.getenv("GEMINI_API_KEY")
 if not api_key:
     st.error("❌ Missing API key! Add GEMINI_API_KEY in .env file.")
     st.stop()
 
-# Configure Gemini client
-genai.configure(api_key=api_key)
-
 # ------------------- CHATBOT UI -------------------
 st.subheader("💬 Gemini AI Chatbot")
 
 # Sidebar options
 with st.sidebar:
     st.title("⚙️ Chat Settings")
-    model_choice = st.selectbox("Model", ["models/gemini-2.5-flash", "models/gemini-2.5-pro"])
-    theme = st.selectbox("Theme", ["Light", "Dark"])
-    if theme == "Dark":
-        st.markdown('<style> .stApp { background-color: #0e1117; color: white; } </style>', unsafe_allow_html=True)
-    else:
-        st.markdown('<style> .stApp { background: linear-gradient(135deg, #a8e063 0%, #56ab2f 100%); } </style>', unsafe_allow_html=True)
+    with st.form("settings"):
+        model_choice = st.selectbox("Model", ["models/gemini-2.5-flash", "models/gemini-2.5-pro"])
+        theme = st.selectbox("Theme", ["Light", "Dark"])
+        st.form_submit_button("Apply")
+    st.markdown(_DARK_CSS if theme == "Dark" else _LIGHT_CSS, unsafe_allow_html=True)
     if st.button("🧹 Clear Chat"):
         st.session_state.messages = []
+        st.session_state.rendered_history = []
+        st.session_state.history_window = HISTORY_WINDOW
+        st.session_state.pop("chat", None)
     st.caption("Powered by Collab Softech")
 
 # Initialize chat history
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-# Display chat
-for message in st.session_state.messages:
-    with st.chat_message(message["role"], avatar="👤" if message["role"] == "user" else "🤖"):
-        st.markdown(message["content"])
+# Display chat: earlier turns go out as one markdown block, and only messages
+# added since the last rerun get formatted
+messages = st.session_state.messages
+rendered = st.session_state.setdefault("rendered_history", [])
+if len(rendered) > len(messages):
+    rendered.clear()
+if len(messages) > MAX_MESSAGES:
+    overflow = len(messages) - MAX_MESSAGES
+    del messages[:overflow]
+    del rendered[:overflow]
+rendered.extend(message_markdown(message) for message in messages[len(rendered):])
+
+# Only the most recent HISTORY_WINDOW messages are drawn until older ones are asked for
+window = st.session_state.setdefault("history_window", HISTORY_WINDOW)
+hidden = len(rendered) - window
+if hidden > 0 and st.button(f"⬆️ Show older messages ({hidden} hidden)", key="show_older"):
+    window = st.session_state.history_window = window + HISTORY_WINDOW
+if rendered:
+    st.markdown("\n\n---\n\n".join(rendered[-window:]))
 
 # Chat input
 if prompt := st.chat_input("Type your message here..."):
+    # Keep one chat session per model so the SDK carries history between turns;
+    # it's only rebuilt from the transcript when the model changes or chat is cleared
+    if "chat" not in st.session_state or st.session_state.get("chat_model") != model_choice:
+        recent = st.session_state.messages[-2 * HISTORY_TURNS:]
+        if recent and recent[0]["role"] == "assistant":
+            recent = recent[1:]
+        st.session_state.chat = get_model(model_choice).start_chat(history=[
+            {"role": "model" if msg["role"] == "assistant" else "user", "parts": [{"text": msg["content"]}]}
+            for msg in recent
+        ])
+        st.session_state.chat_model = model_choice
+
     st.session_state.messages.append({"role": "user", "content": prompt})
     with st.chat_message("user", avatar="👤"):
         st.markdown(prompt)
 
+    chat = st.session_state.chat
+    context = next((m["content"] for m in reversed(st.session_state.messages[:-1]) if m["role"] == "assistant"), "")
+    scope = (model_choice, context)
+    key = prompt_key(model_choice, context, prompt)
     try:
-        model = genai.GenerativeModel(model_choice)
-        chat_history = [{"role": msg["role"], "parts": [{"text": msg["content"]}]} for msg in st.session_state.messages[:-1]]
-        chat = model.start_chat(history=chat_history)
-        response = chat.send_message(prompt)
-        ai_reply = response.text
+        vector = response = None
+        ai_reply = exact_reply(key)
+        if ai_reply is None:
+            vector, ai_reply, response = run_async(
+                start_turn(chat, prompt, st.session_state.setdefault("sem_cache", OrderedDict()), scope)
+            ).result()
 
-        with st.chat_message("assistant", avatar="🤖"):
-            st.markdown(ai_reply)
+        if response is None:
+            # Serve a cached reply, but record the turn so the session keeps its context
+            with st.chat_message("assistant", avatar="🤖"):
+                st.markdown(ai_reply)
+            # The history getter returns the session's own list, so append the delta
+            # rather than re-converting every earlier turn through the setter
+            protos = _genai().protos
+            chat.history.extend([
+                protos.Content(role="user", parts=[protos.Part(text=prompt)]),
+                protos.Content(role="model", parts=[protos.Part(text=ai_reply)]),
+            ])
+        else:
+            # Render tokens as they arrive instead of waiting for the full reply
+            with st.chat_message("assistant", avatar="🤖"):
+                ai_reply = st.write_stream(stream_chunks(response))
+            store_reply(key, scope, vector, ai_reply)
 
+        trim_history(chat)
         st.session_state.messages.append({"role": "assistant", "content": ai_reply})
 
     except Exception as e:
         st.error(f"⚠️ Oops! {e}")
+    finally:
+        # A finished turn has been moved into the history by trim_history. Anything
+        # still pending was cut off: an error, or a rerun/stop during st.write_stream
+        # (BaseExceptions, which no except clause here sees). A partly read stream makes
+        # both the history getter and rewind() raise, so drop the session instead; it's
+        # rebuilt from the transcript on the next turn.
+        if chat.last is not None:
+            st.session_state.pop("chat", None)
 
 # Footer
 st.markdown('<div style="text-align:center; padding:20px; color:white; background:#764ba2;">© 2025 Collab Softech AI Chatbot App</div>', unsafe_allow_html=True)
\ No newline at end of file
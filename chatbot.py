@@ -47,7 +47,14 @@ while True:
     if not user_input:
         continue
     try:
-        response = chat.send_message(user_input)
-        print(f"AI: {response.text}\n")
+        # Print the reply as it streams in instead of waiting for all of it
+        print("AI: ", end="", flush=True)
+        for chunk in chat.send_message(user_input, stream=True):
+            if chunk.parts:
+                print(chunk.text, end="", flush=True)
+        print("\n")
     except Exception as e:
-        print(f"⚠️ Error: {e}\n")
\ No newline at end of file
+        # Drop the broken turn so the next message still has a usable history
+        if chat.last is not None:
+            chat.rewind()
+        print(f"\n⚠️ Error: {e}\n")
\ No newline at end of file
@@ -0,0 +1,51 @@
+# test_app.py
+
+import os
+import re
+import unittest
+
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})(.*)$")
+
+
+def fenced_lines(markdown):
+    """Returns the lines CommonMark renders inside fenced code blocks."""
+    inside, fence = [], None
+    for line in markdown.splitlines():
+        match = _FENCE.match(line)
+        if fence is None:
+            if match:
+                fence = match.group(1)
+            continue
+        if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) and not match.group(2).strip():
+            fence = None
+        else:
+            inside.append(line)
+    return inside
+
+
+class TranscriptTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The chat section stops the script without a key; no request is ever sent
+        os.environ.setdefault("GEMINI_API_KEY", "test")
+
+    def test_fenced_user_message_does_not_swallow_later_messages(self):
+        at = AppTest.from_file(APP)
+        at.session_state["messages"] = [
+            {"role": "user", "content": "```python\nprint('hi')"},
+            {"role": "assistant", "content": "Looks fine."},
+            {"role": "user", "content": "Thanks"},
+        ]
+        at.run()
+        self.assertFalse(at.exception)
+
+        transcript = next(m.value for m in at.markdown if "You:" in m.value)
+        self.assertEqual(fenced_lines(transcript), ["print('hi')"])
+        self.assertIn("**🤖 Gemini:**", transcript)
+
+
+if __name__ == "__main__":
+    unittest.main()
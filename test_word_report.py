@@ -0,0 +1,67 @@
+# test_word_report.py
+
+import http.server
+import itertools
+import threading
+import unittest
+
+import word_report
+
+PAGE = (
+    b"<html><head><title>Chunked page</title>"
+    b"<script async src='https://www.google-analytics.com/analytics.js'></script>"
+    b"</head><body><h1>Hello</h1></body></html>"
+)
+
+
+class ChunkedHandler(http.server.BaseHTTPRequestHandler):
+    """Serves PAGE in chunked transfer pieces of 1-5 bytes; everything else is a 404."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path != "/":
+            return self.do_HEAD()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        sizes = itertools.cycle((1, 2, 3, 4, 5))
+        pos = 0
+        while pos < len(PAGE):
+            piece = PAGE[pos:pos + next(sizes)]
+            pos += len(piece)
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class StreamingAuditTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ChunkedHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_analytics_marker_split_across_small_chunks(self):
+        result = word_report.perform_seo_audit(self.url, revalidate=False)
+        self.assertNotIn("Error", result)
+        self.assertEqual(result["Google Analytics"], "✅ Found")
+        self.assertEqual(result["Title"], "Chunked page")
+
+
+if __name__ == "__main__":
+    unittest.main()
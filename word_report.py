@@ -1,97 +1,398 @@
 # word_report.py
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 from docx import Document
-from urllib.parse import urljoin
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict
+from io import BytesIO
+import asyncio
+import itertools
 import os
+import re
+import string
+import sys
+import threading
 
 
-def perform_seo_audit(url):
-    """Fetches and analyzes a website's content for SEO elements."""
+# One pooled session for every audit: keep-alive reuses the TCP/TLS connection for
+# the 404 probe and for repeat audits of the same host. requests already asks for
+# gzip/deflate (and br/zstd when those decoders are installed).
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    # Retry-After is ignored: urllib3 would sleep for whatever the server asks (no
+    # cap, outside the timeouts), blocking the audit; the short backoff applies instead
+    max_retries=Retry(
+        total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False, respect_retry_after_header=False,
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+# (connect, read): fail fast on unreachable hosts, allow slow pages to finish
+_TIMEOUT = (5.0, 15.0)
+
+# Most audits a batch runs at once. Each running audit can have its 404 probe in
+# _POOL, so the pool is as large; a smaller one would queue probes and cap batch
+# throughput at its size. Workers start on demand, so one audit still uses one.
+_MAX_CONCURRENCY = 32
+
+# Shared workers for side requests that can run while a page downloads and parses
+_POOL = ThreadPoolExecutor(max_workers=_MAX_CONCURRENCY, thread_name_prefix="seo-audit")
+
+# ETag/Last-Modified and the finished result of recent audits, so a repeat audit can
+# send a conditional GET and reuse the result on 304 Not Modified
+_REVALIDATE = OrderedDict()
+_REVALIDATE_SIZE = 128
+_REVALIDATE_LOCK = threading.Lock()
+
+# Tags the audit inspects; everything else is parsed but never surfaced as an event
+_AUDIT_TAGS = ('title', 'meta', 'link', 'h1', 'img', 'script')
+# <img src> values with no alt text, or alt that is only whitespace (incl. &nbsp;)
+_MISSING_ALT_SRC = etree.XPath(
+    "//img[@src != '' and normalize-space(translate(@alt, '\u00a0', ' ')) = '']/@src",
+    smart_strings=False,
+)
+# Responses the audit will parse, and how much of a page it reads before stopping
+_HTML_TYPES = ('text/html', 'application/xhtml+xml')
+_MAX_PAGE_BYTES = 5 * 1024 * 1024
+_MAX_TEXT_CHARS = 500_000
+_CONTENT_TYPE_CHARSET = re.compile(r'charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.I)
+
+# ASCII punctuation -> space, so "seo," and "seo." count as the keyword "seo".
+# str.translate is fastest on pure-ASCII text; the regex wins once any non-ASCII
+# character forces translate off its fast path.
+_PUNCTUATION = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+_PUNCTUATION_RE = re.compile('[%s]' % re.escape(string.punctuation))
+
+# Advanced-checks table rows: (label, audit result key, recommendation)
+_ADVANCED_CHECKS = (
+    ("Social Media Meta Tags", "Social Meta Tags", "Add OG/Twitter tags for better sharing."),
+    ("Google Analytics", "Google Analytics", "Add GA tracking to monitor traffic."),
+    ("Favicon", "Favicon", "Add favicon.ico for branding."),
+    ("Google Search Console", "Google Search Console", "Verify property in GSC."),
+    ("HTTPS / SSL", "HTTPS", "Use SSL certificate for trust and SEO."),
+    ("Structured Data", "Structured Data", "Add schema markup."),
+    ("Custom 404 Page", "Custom 404 Page", "Create branded 404 page."),
+    ("Noindex Tag", "Noindex Tag", "Remove if indexing is needed."),
+    ("Nofollow Tag", "Nofollow Tag", "Review nofollow usage."),
+)
+
+# Serialized blank report; Document() would otherwise re-read python-docx's default
+# template from disk for every report
+_TEMPLATE = None
+
+
+def _page_encodings(response, head):
+    """Lists candidate page encodings: the Content-Type charset, then a <meta charset> near the top, then UTF-8."""
+    candidates = []
+    match = _CONTENT_TYPE_CHARSET.search(response.headers.get('Content-Type', ''))
+    if match:
+        candidates.append(match.group(1))
+    match = _META_CHARSET.search(head[:2048])
+    if match:
+        candidates.append(match.group(1).decode('ascii'))
+    candidates.append('utf-8')
+    return candidates
+
+
+def _pull_parser(encodings):
+    """Builds the audit's HTMLPullParser with the first encoding libxml2 accepts.
+
+    Names are passed as the page declared them: libxml2 knows "EUC-KR" but not
+    Python's canonical "euc_kr", so they can't be normalized through codecs first.
+    """
+    for name in encodings:
+        try:
+            # No id index (nothing looks elements up by id), and comments/PIs never
+            # enter the tree, so it stays smaller for the XPath and text passes
+            return etree.HTMLPullParser(
+                events=('end',), tag=_AUDIT_TAGS, encoding=name,
+                collect_ids=False, remove_comments=True, remove_pis=True,
+            )
+        except LookupError:
+            continue
+    raise LookupError(f"no usable encoding among {encodings}")
+
+
+def _conditional_headers(url):
+    with _REVALIDATE_LOCK:
+        cached = _REVALIDATE.get(url)
+    if cached is None:
+        return {}, None
+    etag, last_modified, result = cached
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers, result
+
+
+def _remember(url, etag, last_modified, result):
+    with _REVALIDATE_LOCK:
+        _REVALIDATE[url] = (etag, last_modified, result)
+        _REVALIDATE.move_to_end(url)
+        if len(_REVALIDATE) > _REVALIDATE_SIZE:
+            _REVALIDATE.popitem(last=False)
+
+
+def _status_code(url):
+    """Returns the HTTP status for url without downloading the response body."""
+    response = _SESSION.head(url, timeout=_TIMEOUT, allow_redirects=True)
+    if response.status_code in (405, 501):
+        # Server refuses HEAD; a streamed GET closed unread still costs only the headers
+        with _SESSION.get(url, timeout=_TIMEOUT, stream=True) as response:
+            pass
+    return response.status_code
+
+
+def _custom_404_status(status_code):
+    return "✅ Exists" if status_code == 404 else "❌ Not Found"
+
+
+def _text(element):
+    return ''.join(element.itertext()).strip()
+
+
+def perform_seo_audit(url, revalidate=True):
+    """Fetches and analyzes a website's content for SEO elements.
+
+    With revalidate (the default) a repeat audit sends a conditional GET and reuses the
+    stored page analysis on 304; revalidate=False always downloads and re-parses.
+    """
     try:
-        response = requests.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        not_found_url = urljoin(url, "/nonexistent-page-xyz")
+    except ValueError as e:  # malformed URL, e.g. "http://[::1"; requests raises InvalidURL for the rest
+        return {"Error": f"Could not access the website: {e}"}
+
+    try:
+        # The 404 probe doesn't depend on the page, so it runs while the page downloads and parses
+        not_found_future = _POOL.submit(_status_code, not_found_url)
+        # Stream the body into lxml's pull parser so parsing overlaps the download
+        # and the raw page is never held in memory as one string
+        conditional, previous = _conditional_headers(url) if revalidate else ({}, None)
+        with _SESSION.get(url, timeout=_TIMEOUT, stream=True, headers=conditional) as response:
+            if response.status_code == 304 and previous is not None:
+                # Only the page is unchanged; the 404 probe hit another URL, so its
+                # fresh answer replaces the stored one
+                result = dict(previous)
+                result["Custom 404 Page"] = _custom_404_status(not_found_future.result())
+                return result
+            response.raise_for_status()
+            # Headers are in before any body is read, so PDFs, videos etc. are
+            # rejected without downloading them
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if content_type and content_type not in _HTML_TYPES:
+                return {"Error": f"Not an HTML page (Content-Type: {content_type})"}
+            final_url = response.url
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            chunks = response.iter_content(chunk_size=64 * 1024)
+            first = next(chunks, b'')
+            parser = _pull_parser(_page_encodings(response, first))
+
+            found = []
+            analytics_present = False
+            tail = b''
+            received = 0
+            for chunk in itertools.chain((first,), chunks):
+                parser.feed(chunk)
+                # --- Analytics / Tracking --- (checked on the raw bytes, with a small
+                # overlap so a marker split across chunks still matches)
+                window = tail + chunk
+                analytics_present = analytics_present or b"gtag(" in window or b"google-analytics.com" in window
+                tail = window[-24:]
+                found.extend(element for _, element in parser.read_events())
+                received += len(chunk)
+                if received >= _MAX_PAGE_BYTES:
+                    break  # audit what arrived; the head and early body carry the signals
+            try:
+                root = parser.close()
+            except etree.LxmlError:
+                root = None  # empty body
+            found.extend(element for _, element in parser.read_events())
 
-        # --- Basic SEO ---
-        title_tag = soup.find('title')
-        meta_description = soup.find('meta', attrs={'name': 'description'})
-        h1_tags = [h1.get_text().strip() for h1 in soup.find_all('h1')]
+        # --- Single pass over every tag the audit reads ---
+        title_tag = meta_description = favicon = gsc_meta = robots_meta = None
+        h1_tags, structured_data = [], []
+        image_count = 0
+        social_meta_present = False
+        for element in found:
+            tag = element.tag
+            if tag == 'img':
+                image_count += 1
+            elif tag == 'h1':
+                h1_tags.append(_text(element))
+            elif tag == 'meta':
+                meta_name = element.get('name') or ''
+                if meta_name == 'description':
+                    meta_description = meta_description if meta_description is not None else element
+                elif meta_name == 'robots':
+                    robots_meta = robots_meta if robots_meta is not None else element
+                elif meta_name == 'google-site-verification':
+                    gsc_meta = gsc_meta if gsc_meta is not None else element
+                if meta_name.startswith('twitter:') or (element.get('property') or '').startswith('og:'):
+                    social_meta_present = True
+            elif tag == 'link':
+                if favicon is None and 'icon' in (element.get('rel') or '').lower():
+                    favicon = element
+            elif tag == 'script':
+                if element.get('type') == 'application/ld+json':
+                    structured_data.append(element)
+            elif title_tag is None:
+                title_tag = element
 
-        # --- Image Alt Audit ---
-        all_images = soup.find_all('img')
+        # --- Image Alt Audit --- (the filter runs in libxml2; only offenders reach Python)
         missing_alt_images = []
-        for img in all_images:
-            src = img.get('src', '')
-            if not src:
-                continue
-            if not img.get('alt') or not img['alt'].strip():
-                file_ext = os.path.splitext(src)[1].lower()
-                missing_alt_images.append({
-                    "src": urljoin(url, src),
-                    "type": file_ext if file_ext else "Unknown"
-                })
-
-        # --- Social Meta ---
-        og_tags = soup.find_all('meta', property=lambda x: x and x.startswith('og:'))
-        twitter_tags = soup.find_all('meta', attrs={'name': lambda x: x and x.startswith('twitter:')})
-        social_meta_present = bool(og_tags or twitter_tags)
+        for src in (_MISSING_ALT_SRC(root) if root is not None else ()):
+            file_ext = os.path.splitext(src)[1].lower()
+            try:
+                src_url = urljoin(url, src)
+            except ValueError:
+                src_url = src  # unparseable src (e.g. "http://[x"); reported as written
+            missing_alt_images.append({
+                "src": src_url,
+                "type": file_ext if file_ext else "Unknown"
+            })
 
         # --- Keywords ---
-        all_text = soup.get_text(separator=' ').lower()
-        words = [w for w in all_text.split() if len(w) > 3]
-        common_keywords = {}
-        for w in words:
-            common_keywords[w] = common_keywords.get(w, 0) + 1
-        sorted_keywords = sorted(common_keywords.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        # --- Analytics / Tracking ---
-        analytics_present = "gtag(" in response.text or "google-analytics.com" in response.text
+        # Only visible body copy counts: head metadata and script/style/noscript/template
+        # bodies are dropped (comments never made it into the tree), and huge pages are
+        # cut at _MAX_TEXT_CHARS
+        if root is not None:
+            body = root.find('body')
+            body = body if body is not None else root
+            etree.strip_elements(body, 'script', 'style', 'noscript', 'template', with_tail=False)
+            all_text = ' '.join(body.itertext())[:_MAX_TEXT_CHARS].lower()
+        else:
+            all_text = ''
+        if all_text.isascii():
+            all_text = all_text.translate(_PUNCTUATION)
+        else:
+            all_text = _PUNCTUATION_RE.sub(' ', all_text)
+        # Counter tallies in C; most_common(10) is a heap top-k with the same
+        # tie order as a stable sort
+        sorted_keywords = Counter(w for w in all_text.split() if len(w) > 3).most_common(10)
 
         # --- Other SEO Signals ---
-        favicon = soup.find("link", rel=lambda x: x and "icon" in x.lower())
-        gsc_meta = soup.find("meta", attrs={"name": "google-site-verification"})
-        final_url = response.url
         redirected = final_url != url
         https_used = url.startswith("https")
-        structured_data = soup.find_all("script", type="application/ld+json")
-        not_found_test = requests.get(urljoin(url, "/nonexistent-page-xyz"), timeout=10)
-        custom_404 = not_found_test.status_code == 404
-        robots_meta = soup.find("meta", attrs={"name": "robots"})
-        noindex = "noindex" in robots_meta["content"].lower() if robots_meta and "content" in robots_meta.attrs else False
-        nofollow = "nofollow" in robots_meta["content"].lower() if robots_meta and "content" in robots_meta.attrs else False
-
-        return {
+        robots_content = (robots_meta.get('content') or '').lower() if robots_meta is not None else ''
+        noindex = "noindex" in robots_content
+        nofollow = "nofollow" in robots_content
+
+        title = _text(title_tag) if title_tag is not None else ""
+        description = (meta_description.get('content') or '').strip() if meta_description is not None else ""
+
+        result = {
             "URL": url,
             "Final URL": final_url,
             "Redirected": redirected,
-            "Title": title_tag.string.strip() if title_tag else "❌ Missing",
-            "Title Length": len(title_tag.string.strip()) if title_tag else 0,
-            "Meta Description": meta_description['content'].strip() if meta_description and 'content' in meta_description else "❌ Missing",
-            "Meta Description Length": len(meta_description['content'].strip()) if meta_description and 'content' in meta_description else 0,
+            "Title": title or "❌ Missing",
+            "Title Length": len(title),
+            "Meta Description": description or "❌ Missing",
+            "Meta Description Length": len(description),
             "H1 Headings": h1_tags if h1_tags else ["❌ Missing"],
             "Missing Alt Images": missing_alt_images,
-            "Total Images": len(all_images),
+            "Total Images": image_count,
             "Social Meta Tags": "✅ Present" if social_meta_present else "❌ Missing",
             "Top Keywords": sorted_keywords,
             "Google Analytics": "✅ Found" if analytics_present else "❌ Missing",
-            "Favicon": "✅ Present" if favicon else "❌ Missing",
-            "Google Search Console": "✅ Verified" if gsc_meta else "❌ Missing",
+            "Favicon": "✅ Present" if favicon is not None else "❌ Missing",
+            "Google Search Console": "✅ Verified" if gsc_meta is not None else "❌ Missing",
             "HTTPS": "✅ Secure" if https_used else "❌ Not Secure",
             "Structured Data": "✅ Found" if structured_data else "❌ Missing",
-            "Custom 404 Page": "✅ Exists" if custom_404 else "❌ Not Found",
+            "Custom 404 Page": _custom_404_status(not_found_future.result()),
             "Noindex Tag": "✅ Present" if noindex else "❌ Not Present",
             "Nofollow Tag": "✅ Present" if nofollow else "❌ Not Present",
         }
+        if etag or last_modified:
+            _remember(url, etag, last_modified, result)
+        return result
 
     except requests.exceptions.RequestException as e:
         return {"Error": f"Could not access the website: {e}"}
 
 
+async def perform_seo_audit_async(url):
+    """Runs perform_seo_audit on a worker thread so an event loop can await it without blocking."""
+    return await asyncio.to_thread(perform_seo_audit, url)
+
+
+async def audit_many(urls, max_concurrency=8):
+    """Audits several URLs concurrently, returning results in the same order as urls.
+
+    max_concurrency is capped at _MAX_CONCURRENCY.
+    """
+    # Workers of its own: asyncio's default executor has only min(32, cpu + 4)
+    # threads, fewer than max_concurrency on small machines
+    pool = ThreadPoolExecutor(max_workers=min(max_concurrency, _MAX_CONCURRENCY), thread_name_prefix="seo-batch")
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.gather(*(loop.run_in_executor(pool, perform_seo_audit, url) for url in urls))
+    finally:
+        pool.shutdown(wait=False)
+
+
+def perform_seo_audit_batch(urls, max_concurrency=8):
+    """Blocking form of audit_many, for callers without an event loop (e.g. the CLI)."""
+    return asyncio.run(audit_many(urls, max_concurrency))
+
+
+def _blank_document():
+    """Returns a new empty Document loaded from the in-memory template bytes."""
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        buf = BytesIO()
+        Document().save(buf)
+        _TEMPLATE = buf.getvalue()
+    return Document(BytesIO(_TEMPLATE))
+
+
+def _set_cell_text(tc, text):
+    """Writes text into a freshly created table cell (its ``w:tc`` element).
+
+    Produces the same XML as ``cell.text = text`` but appends the run to the cell's
+    existing empty paragraph instead of tearing it down, and skips python-docx's
+    per-character run builder, which dominates large tables.
+    """
+    if '\t' in text or '\n' in text or '\r' in text:
+        # Same steps as the cell.text setter, which renders these as <w:tab/>/<w:br/>
+        tc.clear_content()
+        tc.add_p().add_r().text = text
+        return
+    run = OxmlElement('w:r')
+    if text:
+        t = OxmlElement('w:t')
+        t.text = text
+        if text != text.strip():
+            t.set(qn('xml:space'), 'preserve')
+        run.append(t)
+    tc.find(qn('w:p')).append(run)
+
+
+def _fill_row(row, values):
+    """Fills a freshly created table row, one value per cell.
+
+    Walks the row's ``w:tc`` children directly; ``row.cells`` resolves the table
+    grid for every row, which is most of the remaining cost on big tables.
+    """
+    for tc, text in zip(row._tr.tc_lst, values):
+        _set_cell_text(tc, text)
+
+
 def create_word_report(report_data):
     """Creates a Word SEO audit report with professional tables and detailed sections."""
-    doc = Document()
+    doc = _blank_document()
     doc.add_heading("📊 SEO Audit Report", 0)
     doc.add_paragraph(f"URL Analyzed: {report_data.get('URL', 'N/A')}")
 
@@ -103,74 +404,65 @@ def create_word_report(report_data):
     doc.add_heading("1. Meta Title Audit", level=1)
     table = doc.add_table(rows=4, cols=2)
     table.style = 'Light Grid Accent 1'
-    table.cell(0, 0).text = "Title"
-    table.cell(0, 1).text = report_data["Title"]
-    table.cell(1, 0).text = "Length"
-    table.cell(1, 1).text = f"{report_data['Title Length']} characters"
-    table.cell(2, 0).text = "Issue"
-    table.cell(2, 1).text = "❌ Missing or too short (<50 chars)" if report_data['Title Length'] < 50 else "✅ Looks Good"
-    table.cell(3, 0).text = "Recommendation"
-    table.cell(3, 1).text = "Keep title between 50-60 chars, include primary keywords, and ensure uniqueness."
+    rows = table.rows
+    _fill_row(rows[0], ("Title", report_data["Title"]))
+    _fill_row(rows[1], ("Length", f"{report_data['Title Length']} characters"))
+    _fill_row(rows[2], ("Issue", "❌ Missing or too short (<50 chars)" if report_data['Title Length'] < 50 else "✅ Looks Good"))
+    _fill_row(rows[3], ("Recommendation", "Keep title between 50-60 chars, include primary keywords, and ensure uniqueness."))
 
     # --- Meta Description Section ---
     doc.add_heading("2. Meta Description Audit", level=1)
     table = doc.add_table(rows=4, cols=2)
     table.style = 'Light Grid Accent 1'
-    table.cell(0, 0).text = "Meta Description"
-    table.cell(0, 1).text = report_data["Meta Description"]
-    table.cell(1, 0).text = "Length"
-    table.cell(1, 1).text = f"{report_data['Meta Description Length']} characters"
-    table.cell(2, 0).text = "Issue"
-    table.cell(2, 1).text = "❌ Missing or too short (<120 chars)" if report_data['Meta Description Length'] < 120 else "✅ Looks Good"
-    table.cell(3, 0).text = "Recommendation"
-    table.cell(3, 1).text = "Keep description between 140-160 chars, make it compelling and include keywords."
+    rows = table.rows
+    _fill_row(rows[0], ("Meta Description", report_data["Meta Description"]))
+    _fill_row(rows[1], ("Length", f"{report_data['Meta Description Length']} characters"))
+    _fill_row(rows[2], ("Issue", "❌ Missing or too short (<120 chars)" if report_data['Meta Description Length'] < 120 else "✅ Looks Good"))
+    _fill_row(rows[3], ("Recommendation", "Keep description between 140-160 chars, make it compelling and include keywords."))
 
     # --- Missing Alt Text Section ---
     doc.add_heading("3. Missing Image Alt Text", level=1)
     missing_images = report_data["Missing Alt Images"]
     if missing_images:
         doc.add_paragraph(f"❌ Found {len(missing_images)} images missing alt text.")
-        img_table = doc.add_table(rows=1, cols=3)
+        # Size the table up front: python-docx builds all rows from one XML
+        # string, whereas add_row() appends and re-measures one row at a time.
+        img_table = doc.add_table(rows=len(missing_images) + 1, cols=3)
         img_table.style = 'Medium Shading 1 Accent 2'
-        hdr = img_table.rows[0].cells
-        hdr[0].text = "Image Path / URL"
-        hdr[1].text = "File Type"
-        hdr[2].text = "Recommendation"
-        for img in missing_images:
-            row = img_table.add_row().cells
-            row[0].text = img["src"]
-            row[1].text = img["type"].upper()
-            row[2].text = "Add descriptive alt text."
+        rows = img_table.rows
+        _fill_row(rows[0], ("Image Path / URL", "File Type", "Recommendation"))
+        for row, img in zip(rows[1:], missing_images):
+            _fill_row(row, (img["src"], img["type"].upper(), "Add descriptive alt text."))
     else:
         doc.add_paragraph("✅ All images have alt text.")
 
     # --- Advanced SEO Checks ---
     doc.add_heading("4. Advanced SEO Checks", level=1)
-    checks = [
-        ("Social Media Meta Tags", report_data["Social Meta Tags"], "Add OG/Twitter tags for better sharing."),
-        ("Google Analytics", report_data["Google Analytics"], "Add GA tracking to monitor traffic."),
-        ("Favicon", report_data["Favicon"], "Add favicon.ico for branding."),
-        ("Google Search Console", report_data["Google Search Console"], "Verify property in GSC."),
-        ("HTTPS / SSL", report_data["HTTPS"], "Use SSL certificate for trust and SEO."),
-        ("Structured Data", report_data["Structured Data"], "Add schema markup."),
-        ("Custom 404 Page", report_data["Custom 404 Page"], "Create branded 404 page."),
-        ("Noindex Tag", report_data["Noindex Tag"], "Remove if indexing is needed."),
-        ("Nofollow Tag", report_data["Nofollow Tag"], "Review nofollow usage."),
-    ]
-
-    adv_table = doc.add_table(rows=1, cols=3)
+    adv_table = doc.add_table(rows=len(_ADVANCED_CHECKS) + 1, cols=3)
     adv_table.style = 'Medium Grid 1 Accent 1'
-    hdr = adv_table.rows[0].cells
-    hdr[0].text = "Check"
-    hdr[1].text = "Status"
-    hdr[2].text = "Recommendation"
+    rows = adv_table.rows
+    _fill_row(rows[0], ("Check", "Status", "Recommendation"))
 
-    for check, status, rec in checks:
-        row = adv_table.add_row().cells
-        row[0].text = check
-        row[1].text = status
-        row[2].text = rec
+    for row, (check, key, rec) in zip(rows[1:], _ADVANCED_CHECKS):
+        _fill_row(row, (check, report_data[key], rec))
 
     doc.add_paragraph("\n✅ End of Report")
 
-    return doc
\ No newline at end of file
+    return doc
+
+
+if __name__ == "__main__":
+    # python word_report.py URL [URL ...] -> one seo_report_<host>.docx per URL
+    if len(sys.argv) < 2:
+        print("Usage: python word_report.py URL [URL ...]")
+        sys.exit(1)
+    targets = sys.argv[1:]
+    results = perform_seo_audit_batch(targets) if len(targets) > 1 else [perform_seo_audit(targets[0])]
+    for target, data in zip(targets, results):
+        if "Error" in data:
+            # No report for a failed fetch; a malformed URL has no host to name it after either
+            print(f"❌ {target}: {data['Error']}")
+            continue
+        file_name = f"seo_report_{urlparse(target).netloc or 'site'}.docx"
+        create_word_report(data).save(file_name)
+        print(f"✅ {target} -> {file_name}")